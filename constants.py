@@ -45,7 +45,4 @@ UI_BUTTON = (50, 70, 120)
 UI_BUTTON_HOVER = (70, 90, 140)
 
 # Game settings
-MAX_MOVEMENT = 3
-MAX_ATTACK_RANGE = 2
-UNIT_HEALTH = 100
-UNIT_DAMAGE = 25 
\ No newline at end of file
+BASE_HIT_CHANCE = 0.85
\ No newline at end of file
@@ -20,6 +20,7 @@ class Game:
         self.selected_unit = None
         self.game_mode = "move"  # "move" or "attack"
         self.turn_number = 1
+        self.dirty = True  # Redraw only when game state or grid highlights change
         
         self.setup_initial_units()
     
@@ -139,19 +140,25 @@ class Game:
     
     def handle_events(self):
         """Handle pygame events"""
+        mouse_motion_pos = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEMOTION:
+                # Coalesce motion events; only the latest position matters for hover
+                mouse_motion_pos = event.pos
+                continue
+            
+            # Any other event (input, window expose, ...) may change what is on screen
+            self.dirty = True
+            
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     hex_coord = self.grid.handle_mouse_event(event.pos, "click")
                     if hex_coord:
                         self.handle_hex_click(hex_coord)
             
-            elif event.type == pygame.MOUSEMOTION:
-                self.grid.handle_mouse_event(event.pos, "hover")
-            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.end_turn()
@@ -163,6 +170,9 @@ class Game:
                 elif event.key == pygame.K_a and self.selected_unit:
                     self.game_mode = "attack"
         
+        if mouse_motion_pos:
+            self.grid.handle_mouse_event(mouse_motion_pos, "hover")
+        
         return True
     
     def draw_ui(self):
@@ -250,7 +260,10 @@ class Game:
         running = True
         while running:
             running = self.handle_events()
-            self.draw()
+            if self.dirty or self.grid.dirty:
+                self.draw()
+                self.dirty = False
+                self.grid.dirty = False
             self.clock.tick(FPS)
         
         pygame.quit()
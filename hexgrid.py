@@ -1,5 +1,6 @@
 import pygame
 import math
+import numpy as np
 from constants import *
 
 class HexGrid:
@@ -7,7 +8,9 @@ class HexGrid:
         self.hexagons = {}
         self.selected_hex = None
         self.hovered_hex = None
+        self.dirty = True  # Set when selection or hover changes and the grid needs redrawing
         self.create_grid()
+        self.create_pick_map()
     
     def create_grid(self):
         """Create the hexagonal grid"""
@@ -16,6 +19,52 @@ class HexGrid:
                 # Offset coordinates for better grid layout
                 self.hexagons[(q, r)] = Hexagon(q, r)
     
+    def create_pick_map(self):
+        """Precompute the index of the hex under every screen pixel (-1 if none)"""
+        self.hex_coords = [(q, r) for q in range(GRID_WIDTH) for r in range(GRID_HEIGHT)]
+        # int32 so indices don't wrap on big maps
+        self.pick_map = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH), dtype=np.int32)
+        
+        # Build in bands of rows to keep the float temporaries small
+        band_height = 64
+        for top in range(0, SCREEN_HEIGHT, band_height):
+            bottom = min(top + band_height, SCREEN_HEIGHT)
+            self.pick_map[top:bottom] = self.pick_rows(top, bottom)
+    
+    def pick_rows(self, top, bottom):
+        """Hex indices for screen rows top..bottom, same math as pixel_to_hex/hex_round"""
+        y, x = np.ogrid[top:bottom, 0:SCREEN_WIDTH]
+        x = x - GRID_OFFSET_X
+        y = y - GRID_OFFSET_Y
+        q = (math.sqrt(3)/3 * x - 1/3 * y) / HEX_RADIUS
+        r = (2/3 * y) / HEX_RADIUS
+        s = -q - r
+        rq = np.round(q)
+        rr = np.round(r)
+        rs = np.round(s)
+        
+        q_diff = np.abs(rq - q)
+        r_diff = np.abs(rr - r)
+        s_diff = np.abs(rs - s)
+        
+        fix_q = (q_diff > r_diff) & (q_diff > s_diff)
+        fix_r = ~fix_q & (r_diff > s_diff)
+        rq = np.where(fix_q, -rr - rs, rq).astype(np.int32)
+        rr = np.where(fix_r, -rq - rs, rr).astype(np.int32)
+        
+        in_grid = (rq >= 0) & (rq < GRID_WIDTH) & (rr >= 0) & (rr < GRID_HEIGHT)
+        return np.where(in_grid, rq * GRID_HEIGHT + rr, -1)
+    
+    def hex_at_pixel(self, x, y):
+        """Look up the grid hex under a pixel, or None if there is no hex there"""
+        if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
+            index = self.pick_map[y, x]
+            return self.hex_coords[index] if index >= 0 else None
+        
+        # Off-screen positions fall back to the exact conversion
+        hex_coord = self.pixel_to_hex(x, y)
+        return hex_coord if hex_coord in self.hexagons else None
+    
     def pixel_to_hex(self, x, y):
         """Convert pixel coordinates to hex coordinates"""
         # Adjust for grid offset
@@ -77,13 +126,17 @@ class HexGrid:
     
     def handle_mouse_event(self, mouse_pos, event_type):
         """Handle mouse events on the grid"""
-        hex_coord = self.pixel_to_hex(mouse_pos[0], mouse_pos[1])
+        hex_coord = self.hex_at_pixel(mouse_pos[0], mouse_pos[1])
         
-        if hex_coord in self.hexagons:
+        if hex_coord:
             if event_type == "hover":
-                self.hovered_hex = hex_coord
+                # Only mark dirty when the cursor actually enters a different hex
+                if hex_coord != self.hovered_hex:
+                    self.hovered_hex = hex_coord
+                    self.dirty = True
             elif event_type == "click":
                 self.selected_hex = hex_coord
+                self.dirty = True
                 return hex_coord
         return None
     
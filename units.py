@@ -1,26 +1,77 @@
 import pygame
 import math
+import os
+import json
 import random
 from constants import *
 
+UNIT_TYPES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unit_types.json")
+
+class CombatModifier:
+    """Damage and hit chance adjustments applied against a target category"""
+    __slots__ = ("damage_multiplier", "hit_chance", "hit_chance_multiplier")
+    
+    def __init__(self, damage_multiplier=1.0, hit_chance=None, hit_chance_multiplier=1.0):
+        self.damage_multiplier = damage_multiplier
+        self.hit_chance = hit_chance  # Overrides the current hit chance when set
+        self.hit_chance_multiplier = hit_chance_multiplier
+
+class UnitType:
+    """Static stats and combat modifiers shared by every unit of one type"""
+    __slots__ = ("code", "name", "category", "max_health", "damage", "max_movement",
+                 "attack_range", "modifiers", "disrupted_by", "disruption_multiplier")
+    
+    def __init__(self, code, data):
+        self.code = code
+        self.name = data["name"]
+        self.category = data["category"]
+        self.max_health = data["health"]
+        self.damage = data["damage"]
+        self.max_movement = data["movement"]
+        self.attack_range = data["attack_range"]
+        self.modifiers = {
+            category: CombatModifier(**modifier)
+            for category, modifier in data.get("modifiers", {}).items()
+        }
+        self.disrupted_by = data.get("disrupted_by")
+        self.disruption_multiplier = data.get("disruption_multiplier", 1.0)
+
+def load_unit_types(path=UNIT_TYPES_FILE):
+    """Load the unit type registry from a JSON file, keyed by unit code"""
+    with open(path) as f:
+        data = json.load(f)
+    return {code: UnitType(code, stats) for code, stats in data.items()}
+
+UNIT_TYPES = load_unit_types()
+
 class Unit:
-    def __init__(self, q, r, player, unit_type="Marine"):
+    # Only mutable per-unit state lives on instances; static stats are class attributes
+    __slots__ = ("q", "r", "player", "health", "movement_points",
+                 "has_attacked", "has_moved")
+    
+    # Visual properties
+    size = HEX_RADIUS // 2
+    player_colors = {1: PLAYER1_COLOR, 2: PLAYER2_COLOR}
+    
+    def __init_subclass__(cls, code=None, **kwargs):
+        """Copy static stats from the unit type registry onto the subclass"""
+        super().__init_subclass__(**kwargs)
+        if code is not None:
+            cls.stats = UNIT_TYPES[code]
+            cls.unit_type = code
+            cls.max_health = cls.stats.max_health
+            cls.damage = cls.stats.damage
+            cls.max_movement = cls.stats.max_movement
+            cls.attack_range = cls.stats.attack_range
+    
+    def __init__(self, q, r, player):
         self.q = q
         self.r = r
         self.player = player
-        self.unit_type = unit_type
-        self.health = UNIT_HEALTH
-        self.max_health = UNIT_HEALTH
-        self.damage = UNIT_DAMAGE
-        self.movement_points = MAX_MOVEMENT
-        self.max_movement = MAX_MOVEMENT
-        self.attack_range = MAX_ATTACK_RANGE
+        self.health = self.max_health
+        self.movement_points = self.max_movement
         self.has_attacked = False
         self.has_moved = False
-        
-        # Visual properties
-        self.color = PLAYER1_COLOR if player == 1 else PLAYER2_COLOR
-        self.size = HEX_RADIUS // 2
     
     def can_move_to(self, target_q, target_r, game_state):
         """Check if unit can move to target hex"""
@@ -58,30 +109,27 @@ class Unit:
     def attack(self, target_unit, game_state):
         """Attack target unit with hit chance calculation"""
         if target_unit:
-            # Base hit chance is 85%
-            hit_chance = 0.85
+            hit_chance = BASE_HIT_CHANCE
             damage = self.damage
             
-            # Check for Assault Marine interference (sniper penalty)
-            if self.unit_type == "SN" and target_unit.player != self.player:
-                # Check if target is adjacent to any enemy Assault units
+            # Disruption penalty (e.g. snipers next to enemy Assault units)
+            if self.stats.disrupted_by and target_unit.player != self.player:
+                # Check if target is adjacent to any enemy disrupting units
                 target_neighbors = game_state.grid.get_neighbors(target_unit.q, target_unit.r)
                 for neighbor_q, neighbor_r in target_neighbors:
                     neighbor_unit = game_state.get_unit_at(neighbor_q, neighbor_r)
-                    if (neighbor_unit and neighbor_unit.unit_type == "AM" 
+                    if (neighbor_unit and neighbor_unit.unit_type == self.stats.disrupted_by
                         and neighbor_unit.player != self.player):
-                        hit_chance *= 0.5  # 50% less chance to hit
+                        hit_chance *= self.stats.disruption_multiplier
                         break
             
-            # Anti-Vehicle Marine specialization
-            if self.unit_type == "AV":
-                if target_unit.unit_type in ["T", "AR"]:
-                    # Bonus vs vehicles
-                    damage = int(damage * 2.0)  # Double damage vs vehicles
-                    hit_chance = 0.95  # Higher accuracy vs vehicles
-                elif target_unit.unit_type in ["MA", "AM", "SN"]:
-                    # Penalty vs infantry
-                    hit_chance *= 0.5  # 50% less chance to hit infantry
+            # Specialization against the target's category (e.g. Anti-Vehicle)
+            modifier = self.stats.modifiers.get(target_unit.stats.category)
+            if modifier:
+                damage = int(damage * modifier.damage_multiplier)
+                if modifier.hit_chance is not None:
+                    hit_chance = modifier.hit_chance
+                hit_chance *= modifier.hit_chance_multiplier
             
             # Roll for hit
             if random.random() <= hit_chance:
@@ -115,7 +163,7 @@ class Unit:
         x, y = self.get_pixel_position()
         
         # Draw unit body
-        pygame.draw.circle(screen, self.color, (x, y), self.size)
+        pygame.draw.circle(screen, self.player_colors[self.player], (x, y), self.size)
         pygame.draw.circle(screen, UNIT_OUTLINE, (x, y), self.size, 2)
         
         # Draw health bar
@@ -168,62 +216,20 @@ class Unit:
                 surface.fill(RED)
                 screen.blit(surface, (hexagon.x - HEX_RADIUS, hexagon.y - HEX_RADIUS))
 
-class Marine(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "MA")
-        self.health = 80
-        self.max_health = 80
-        self.damage = 20
-        self.movement_points = 3
-        self.max_movement = 3
-        self.attack_range = 2
+class Marine(Unit, code="MA"):
+    __slots__ = ()
 
-class Assault(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "AM")
-        self.health = 120
-        self.max_health = 120
-        self.damage = 35
-        self.movement_points = 4
-        self.max_movement = 4
-        self.attack_range = 1
+class Assault(Unit, code="AM"):
+    __slots__ = ()
 
-class Sniper(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "SN")
-        self.health = 60
-        self.max_health = 60
-        self.damage = 40
-        self.movement_points = 2
-        self.max_movement = 2
-        self.attack_range = 3
+class Sniper(Unit, code="SN"):
+    __slots__ = ()
 
-class Artillery(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "AR")
-        self.health = 50
-        self.max_health = 50
-        self.damage = 60
-        self.movement_points = 1
-        self.max_movement = 1
-        self.attack_range = 4
+class Artillery(Unit, code="AR"):
+    __slots__ = ()
 
-class Tank(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "T")
-        self.health = 150
-        self.max_health = 150
-        self.damage = 45
-        self.movement_points = 2
-        self.max_movement = 2
-        self.attack_range = 2
+class Tank(Unit, code="T"):
+    __slots__ = ()
 
-class AntiVehicle(Unit):
-    def __init__(self, q, r, player):
-        super().__init__(q, r, player, "AV")
-        self.health = 70
-        self.max_health = 70
-        self.damage = 30
-        self.movement_points = 3
-        self.max_movement = 3
-        self.attack_range = 2 
\ No newline at end of file
+class AntiVehicle(Unit, code="AV"):
+    __slots__ = ()